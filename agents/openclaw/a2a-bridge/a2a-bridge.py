@@ -8,32 +8,113 @@ translates the responses back to A2A format.
 Also serves /.well-known/agent.json and /.well-known/agent-card.json
 from the mounted ConfigMap directory for Kagenti operator discovery.
 
-Stdlib only -- runs on ubi9:latest with no pip packages.
+Stdlib only -- runs on ubi9:latest with no pip packages. orjson is
+picked up automatically when present for faster JSON on the hot paths.
 """
 
+import http.client
+import io
 import json
 import os
+import queue
 import re
-import uuid
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+import secrets
+import select
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from http.client import HTTPException
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps = orjson.dumps  # emits UTF-8 bytes directly, no str round trip
+else:
+    loads = json.loads
+
+    def dumps(obj):
+        return json.dumps(obj).encode()
 
 GATEWAY_URL = os.environ.get("GATEWAY_URL", "http://localhost:18789")
 GATEWAY_TOKEN = os.environ.get("GATEWAY_TOKEN", "")
 AGENT_ID = os.environ.get("AGENT_ID", "")
 AGENT_CARD_DIR = os.environ.get("AGENT_CARD_DIR", "/srv/.well-known")
 LISTEN_PORT = int(os.environ.get("LISTEN_PORT", "8080"))
+MAX_WORKERS = int(os.environ.get("BRIDGE_MAX_WORKERS", "64"))
+# Deltas arriving within this window are coalesced into one SSE event
+# (0 disables and forwards every delta immediately).
+COALESCE_MS = float(os.environ.get("BRIDGE_COALESCE_MS", "8"))
+# Largest accepted A2A request body; Content-Length is untrusted input
+# and must not size an arbitrary allocation.
+MAX_BODY = 1 << 20
+# Non-streaming sends queued within this window go to the gateway as
+# one concurrent batch over warm connections.
+BATCH_MAX = int(os.environ.get("BRIDGE_BATCH_MAX", "8"))
+BATCH_WINDOW_MS = float(os.environ.get("BRIDGE_BATCH_WINDOW_MS", "2"))
+
+# XFCC format: URI=spiffe://domain/sa/agent-name;...
+_XFCC_RE = re.compile(r"URI=spiffe://[^/]+/sa/([^;,\s]+)")
+
+# Kubernetes probes hit /healthz constantly; serve a pre-rendered
+# response with a single write, skipping the per-request header
+# formatting (and its Date strftime) entirely.
+_HEALTH_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"Content-Length: 2\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+    b"ok"
+)
+
+# Task IDs only need to be unique, not RFC 4122 UUIDs: token_hex is one
+# getrandom call with no UUID object or hyphen formatting.
+_new_id = secrets.token_hex
+
+
+# Agent cards come from a ConfigMap mount and virtually never change
+# (updates arrive as an atomic symlink swap), so serve pre-encoded bytes
+# from RAM and only re-stat the file every few seconds.
+_CARD_TTL = 5.0
+_card_cache = {}  # filename -> (body, content_length, mtime, next_check)
+_card_lock = threading.Lock()
 
 
 def read_agent_card(filename):
+    """Return (body_bytes, content_length_str) for a card, or None."""
+    now = time.monotonic()
+    with _card_lock:
+        entry = _card_cache.get(filename)
+    if entry is not None and now < entry[3]:
+        return entry[0], entry[1]
+
     path = os.path.join(AGENT_CARD_DIR, filename)
     try:
-        with open(path) as f:
-            return f.read()
-    except FileNotFoundError:
+        mtime = os.stat(path).st_mtime
+        if entry is not None and entry[2] == mtime:
+            body = entry[0]
+        else:
+            with open(path, "rb") as f:
+                body = f.read()
+    except OSError:
+        with _card_lock:
+            _card_cache.pop(filename, None)
         return None
 
+    entry = (body, str(len(body)), mtime, now + _CARD_TTL)
+    with _card_lock:
+        _card_cache[filename] = entry
+    return entry[0], entry[1]
+
 
 def extract_sender_id(http_headers):
     """Derive a stable sender identity from inbound request headers.
@@ -46,8 +127,7 @@ def extract_sender_id(http_headers):
     # Kagenti envoy adds XFCC with the remote agent's SPIFFE ID
     xfcc = http_headers.get("x-forwarded-client-cert", "")
     if xfcc:
-        # XFCC format: URI=spiffe://domain/sa/agent-name;...
-        match = re.search(r"URI=spiffe://[^/]+/sa/([^;,\s]+)", xfcc)
+        match = _XFCC_RE.search(xfcc)
         if match:
             return f"a2a:{match.group(1)}"
 
@@ -59,36 +139,298 @@ def extract_sender_id(http_headers):
     return None
 
 
+_GATEWAY = urlsplit(GATEWAY_URL)
+_GATEWAY_PATH = _GATEWAY.path.rstrip("/") + "/v1/chat/completions"
+_local = threading.local()
+
+# GATEWAY_TOKEN and AGENT_ID never change after startup -- build the
+# request headers once instead of on every call.
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {GATEWAY_TOKEN}",
+    "Connection": "keep-alive",
+}
+if AGENT_ID:
+    _BASE_HEADERS["x-openclaw-agent-id"] = AGENT_ID
+
+
+def _gateway_conn():
+    """Return this thread's keep-alive connection to the gateway."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        if _GATEWAY.scheme == "https":
+            conn = http.client.HTTPSConnection(
+                _GATEWAY.hostname, _GATEWAY.port or 443, timeout=300)
+        else:
+            conn = http.client.HTTPConnection(
+                _GATEWAY.hostname, _GATEWAY.port or 80, timeout=300)
+        _local.conn = conn
+    return conn
+
+
+def _drop_gateway_conn():
+    """Discard this thread's gateway connection (stale or half-read)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        _local.conn = None
+        conn.close()
+
+
 def call_gateway(messages, stream=False, sender_id=None):
-    """POST to the OpenClaw gateway's OpenAI-compatible endpoint."""
-    body = json.dumps({
+    """POST to the OpenClaw gateway's OpenAI-compatible endpoint.
+
+    Reuses a per-thread keep-alive connection so repeated A2A requests
+    skip the TCP (and TLS) handshake. Raises HTTPError on non-2xx so
+    callers see the same error shape urlopen used to produce.
+    """
+    body = dumps({
         "messages": messages,
         "stream": stream,
-    }).encode()
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {GATEWAY_TOKEN}",
-    }
-    if AGENT_ID:
-        headers["x-openclaw-agent-id"] = AGENT_ID
+    })
     if sender_id:
-        headers["x-openclaw-user"] = sender_id
-    req = Request(
-        f"{GATEWAY_URL}/v1/chat/completions",
-        data=body,
-        headers=headers,
-        method="POST",
-    )
-    return urlopen(req, timeout=300)
+        headers = {**_BASE_HEADERS, "x-openclaw-user": sender_id}
+    else:
+        headers = _BASE_HEADERS
+
+    resp = None
+    for attempt in (0, 1):
+        reused = getattr(_local, "conn", None) is not None
+        conn = _gateway_conn()
+        try:
+            conn.request("POST", _GATEWAY_PATH, body=body, headers=headers)
+            resp = conn.getresponse()
+            break
+        except socket.timeout:
+            # The gateway may have received and be processing the
+            # request -- chat completions aren't idempotent, so a
+            # timeout is never safe to re-send.
+            _drop_gateway_conn()
+            raise
+        except (HTTPException, OSError):
+            _drop_gateway_conn()
+            # Only a reused keep-alive socket that died before any
+            # response is safe to retry; a fresh connection failing is
+            # a real error.
+            if not reused or attempt:
+                raise
+    if resp.status >= 400:
+        # Drain the error body here so the keep-alive socket stays
+        # clean for the next request on this thread, and so the
+        # exception is self-contained wherever it ends up being read.
+        raise HTTPError(f"{GATEWAY_URL}{_GATEWAY_PATH}", resp.status,
+                        resp.reason, resp.msg, io.BytesIO(resp.read()))
+    return resp
+
+
+# Non-streaming message/send batcher: handler threads queue work and
+# block on a Future; a single worker drains the queue in BATCH_WINDOW_MS
+# windows and dispatches up to BATCH_MAX calls concurrently over the
+# send pool's warm keep-alive connections, amortizing per-request
+# overhead when many A2A sends arrive together.
+_send_queue = queue.Queue()
+_send_pool = ThreadPoolExecutor(max_workers=BATCH_MAX)
+
+
+def submit_send(messages, sender_id=None):
+    """Queue a non-streaming gateway call; returns a Future of the
+    parsed completion response."""
+    future = Future()
+    _send_queue.put((future, messages, sender_id))
+    return future
+
+
+def _dispatch_send(item):
+    future, messages, sender_id = item
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        resp = call_gateway(messages, stream=False, sender_id=sender_id)
+        future.set_result(loads(_read_body(resp)))
+    except HTTPError as e:
+        # The handler thread will e.read() this, so it must never carry
+        # a response still bound to this pool thread's connection.
+        # call_gateway already drains into BytesIO; enforce it here in
+        # case that ever regresses.
+        if not isinstance(e.fp, io.BytesIO):
+            try:
+                body = e.read()
+            except (HTTPException, OSError):
+                body = b""
+            e.fp = io.BytesIO(body)
+        future.set_exception(e)
+    except BaseException as e:
+        future.set_exception(e)
+
+
+def _send_worker():
+    while True:
+        batch = [_send_queue.get()]
+        deadline = time.monotonic() + BATCH_WINDOW_MS / 1000.0
+        while len(batch) < BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_send_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        for item in batch:
+            _send_pool.submit(_dispatch_send, item)
+
+
+threading.Thread(target=_send_worker, name="send-batcher", daemon=True).start()
 
 
 def extract_text(parts):
     """Extract concatenated text from A2A message parts."""
-    texts = []
-    for part in parts:
+    # A2A messages almost always carry a single text part -- return it
+    # directly without building an intermediate list.
+    if len(parts) == 1:
+        part = parts[0]
         if part.get("kind") == "text" and "text" in part:
-            texts.append(part["text"])
-    return "\n".join(texts)
+            return part["text"]
+        return ""
+    return "\n".join(
+        part["text"] for part in parts
+        if part.get("kind") == "text" and "text" in part
+    )
+
+
+def _read_body(resp):
+    """Read a response body into a buffer preallocated from
+    Content-Length, skipping the extra copy read() makes; falls back to
+    read() when the length is unknown (chunked transfer)."""
+    length = resp.length
+    if not length:
+        return resp.read()
+    buf = bytearray(length)
+    read = 0
+    with memoryview(buf) as view:
+        while read < length:
+            n = resp.readinto(view[read:])
+            if not n:
+                break
+            read += n
+    if read < length:
+        del buf[read:]
+    return buf
+
+
+def _response_socket(resp):
+    """Best-effort handle on the socket under a streaming response.
+
+    http.client detaches a will-close response from its connection as
+    soon as getresponse() returns, so conn.sock alone isn't reliable;
+    the response's own file object still wraps the socket.
+    """
+    raw = getattr(resp.fp, "raw", None)
+    sock = getattr(raw, "_sock", None)
+    if sock is not None:
+        return sock
+    conn = getattr(_local, "conn", None)
+    return conn.sock if conn is not None else None
+
+
+def _buffered_ready(resp):
+    """True if the response's buffered layer holds bytes that read1 can
+    return without touching the socket.
+
+    Must be called with the socket in non-blocking mode. For chunked
+    framing, leftover framing bytes don't count: the previous chunk's
+    trailing CRLF or a headerless size line would be consumed by read1,
+    which then blocks on the wire for the rest.
+    """
+    try:
+        buffered = resp.fp.peek(1)
+    except (ValueError, OSError):
+        return False
+    if not buffered:
+        return False
+    if not resp.chunked:
+        return True
+    if resp.chunk_left:
+        # Mid-chunk: buffered bytes are payload
+        return True
+    if resp.chunk_left == 0:
+        # read1 discards the previous chunk's trailing CRLF first
+        buffered = buffered[2:]
+    nl = buffered.find(b"\n")
+    if nl < 0:
+        return False  # incomplete chunk-size line
+    try:
+        size = int(buffered[:nl].split(b";", 1)[0].strip(), 16)
+    except ValueError:
+        return True  # malformed framing -- let read1 raise it
+    if size == 0:
+        return True  # terminal chunk: read1 returns b"" promptly
+    return len(buffered) > nl + 1  # at least one payload byte follows
+
+
+def _data_ready(resp, sock):
+    """True if a read can return without blocking -- decodable bytes
+    already buffered above the socket, or data readable on the wire.
+
+    The probe peeks with a zero timeout and never consumes anything, so
+    chunked-decoding state is untouched.
+    """
+    try:
+        prev = sock.gettimeout()
+        sock.settimeout(0)
+    except OSError:
+        return True  # let the real read surface whatever is wrong
+    try:
+        return _buffered_ready(resp)
+    finally:
+        sock.settimeout(prev)
+
+
+def _iter_sse_data(resp, chunk_size=8192, sock=None, idle_timeout=None,
+                   has_pending=None):
+    """Yield the payload bytes of each upstream 'data:' SSE line.
+
+    Reads the response in chunks via read1 (which returns as soon as
+    any data arrives, keeping per-token latency) and scans each chunk
+    once for line breaks, instead of paying readline's bookkeeping per
+    delta. Only lines split across a chunk boundary are carried over.
+
+    While the caller reports buffered output (has_pending), an idle
+    wait is bounded by idle_timeout and yields None so the caller can
+    flush -- a delta burst followed by a long upstream pause must not
+    sit buffered until the next token arrives. The wait is a
+    non-consuming readiness check (peek + select), never a read
+    timeout: interrupting the chunked parser mid-read would corrupt its
+    framing state.
+    """
+    read1 = getattr(resp, "read1", None) or resp.read
+    tail = b""
+    while True:
+        if (sock is not None and idle_timeout and has_pending()
+                and not _data_ready(resp, sock)):
+            if not select.select([sock], [], [], idle_timeout)[0]:
+                yield None
+                continue
+        chunk = read1(chunk_size)
+        if not chunk:
+            break
+        if tail:
+            chunk = tail + chunk
+            tail = b""
+        start = 0
+        while True:
+            nl = chunk.find(b"\n", start)
+            if nl < 0:
+                tail = chunk[start:]
+                break
+            line = chunk[start:nl]
+            start = nl + 1
+            if line.startswith(b"data: "):
+                payload = line[6:].strip()
+                if payload:
+                    yield payload
+    if tail.startswith(b"data: "):
+        payload = tail[6:].strip()
+        if payload:
+            yield payload
 
 
 def a2a_result(rpc_id, text):
@@ -97,7 +439,7 @@ def a2a_result(rpc_id, text):
         "jsonrpc": "2.0",
         "id": rpc_id,
         "result": {
-            "id": str(uuid.uuid4()),
+            "id": _new_id(16),
             "status": {
                 "state": "COMPLETED",
                 "message": {
@@ -119,42 +461,81 @@ def a2a_error(rpc_id, code, message):
 
 
 class A2ABridgeHandler(BaseHTTPRequestHandler):
+    # SSE streams are many small writes; without TCP_NODELAY Nagle can
+    # hold a token back until the next one (or the delayed ACK) arrives.
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        # Long-idle streams: keep the connection alive through
+        # middleboxes that drop silent TCP sessions.
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
     def log_message(self, fmt, *args):
         print(f"[a2a-bridge] {fmt % args}")
 
     # --- GET: agent card ---
 
     def do_GET(self):
+        if self.path == "/healthz":
+            self.wfile.write(_HEALTH_RESPONSE)
+            self.close_connection = True
+            return
+
         if self.path in ("/.well-known/agent.json", "/.well-known/agent-card.json"):
             filename = self.path.rsplit("/", 1)[-1]
-            content = read_agent_card(filename)
-            if content is not None:
+            card = read_agent_card(filename)
+            if card is not None:
+                body, content_length = card
                 self.send_response(200)
                 self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", content_length)
                 self.end_headers()
-                self.wfile.write(content.encode())
+                self.wfile.write(body)
                 return
             self.send_error(404, f"{filename} not found")
             return
 
-        if self.path == "/healthz":
-            self.send_response(200)
-            self.send_header("Content-Type", "text/plain")
-            self.end_headers()
-            self.wfile.write(b"ok")
-            return
-
         self.send_error(404, "Not found")
 
     # --- POST: A2A JSON-RPC ---
 
     def do_POST(self):
-        content_length = int(self.headers.get("Content-Length", 0))
-        raw = self.rfile.read(content_length)
+        # Reject malformed traffic before touching the body -- no
+        # allocation and no parser invocation on the error paths.
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.split(";", 1)[0].strip().lower() != "application/json":
+            self.send_error(415, "Content-Type must be application/json")
+            return
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            self.send_error(400, "Invalid Content-Length")
+            return
+        if content_length == 0:
+            self.send_error(400, "Empty request body")
+            return
+        if content_length < 0 or content_length > MAX_BODY:
+            self.send_error(413, "Request body too large")
+            return
+
+        # readinto a preallocated buffer -- no intermediate bytes copy,
+        # and the allocation is bounded by MAX_BODY above.
+        raw = bytearray(content_length)
+        view = memoryview(raw)
+        read = 0
+        while read < content_length:
+            n = self.rfile.readinto(view[read:])
+            if not n:
+                break
+            read += n
+        if read < content_length:
+            self.send_error(400, "Truncated request body")
+            return
 
         try:
-            req = json.loads(raw)
-        except json.JSONDecodeError:
+            req = loads(raw)
+        except ValueError:
             self._send_json(400, a2a_error(None, -32700, "Parse error"))
             return
 
@@ -185,11 +566,12 @@ class A2ABridgeHandler(BaseHTTPRequestHandler):
 
     def _handle_send(self, rpc_id, messages, sender_id=None):
         try:
-            resp = call_gateway(messages, stream=False, sender_id=sender_id)
-            data = json.loads(resp.read())
+            data = submit_send(messages, sender_id).result(timeout=300)
             text = data["choices"][0]["message"]["content"]
             self._send_json(200, a2a_result(rpc_id, text))
-        except (HTTPError, URLError) as e:
+        except FutureTimeout:
+            self._send_json(200, a2a_error(rpc_id, -32000, "Gateway error: timed out"))
+        except (HTTPException, OSError) as e:
             msg = str(e)
             if hasattr(e, "read"):
                 msg = e.read().decode(errors="replace")[:500]
@@ -198,10 +580,10 @@ class A2ABridgeHandler(BaseHTTPRequestHandler):
             self._send_json(200, a2a_error(rpc_id, -32000, f"Bad gateway response: {e}"))
 
     def _handle_stream(self, rpc_id, messages, sender_id=None):
-        task_id = str(uuid.uuid4())
+        task_id = _new_id(16)
         try:
             resp = call_gateway(messages, stream=True, sender_id=sender_id)
-        except (HTTPError, URLError) as e:
+        except (HTTPException, OSError) as e:
             msg = str(e)
             if hasattr(e, "read"):
                 msg = e.read().decode(errors="replace")[:500]
@@ -215,39 +597,72 @@ class A2ABridgeHandler(BaseHTTPRequestHandler):
         self.send_header("Connection", "keep-alive")
         self.end_headers()
 
-        collected_text = ""
+        # Every WORKING event shares its structure; only the delta text
+        # varies. Pre-render the envelope once per stream and splice in
+        # the JSON-escaped delta, instead of building the nested dict
+        # and serializing it from scratch for every token.
+        sse_prefix = (
+            b'event: message/stream\ndata: {"jsonrpc":"2.0","id":'
+            + dumps(rpc_id)
+            + b',"result":{"id":"' + task_id.encode()
+            + b'","status":{"state":"WORKING","message":{"role":"agent",'
+            b'"parts":[{"kind":"text","text":'
+        )
+        sse_suffix = b'}]}}}}\n\n'
+
+        # Accumulate deltas in a list -- += on a shared str degrades to
+        # O(n^2) on long completions.
+        collected = []
+
+        # Coalesce deltas that land within COALESCE_MS of the last
+        # flush into one event: on fast token streams this cuts the
+        # JSON, write, and TCP-segment count per event several-fold,
+        # while slow streams still see every delta forwarded at once.
+        window = COALESCE_MS / 1000.0
+        pending = []
+        last_flush = 0.0
+
+        def flush_pending():
+            text = pending[0] if len(pending) == 1 else "".join(pending)
+            self._send_frames((sse_prefix, dumps(text), sse_suffix))
+            pending.clear()
+
+        # The upstream socket lets the scanner cap its read while deltas
+        # are buffered, so the hold is bounded by the window even when
+        # the gateway pauses mid-stream (tool calls, thinking).
+        upstream_sock = _response_socket(resp)
+
         try:
-            for line in resp:
-                line = line.decode("utf-8", errors="replace").strip()
-                if not line.startswith("data: "):
+            # SSE framing is pure ASCII and the JSON parser takes UTF-8
+            # bytes natively, so stay in bytes -- no per-line decode.
+            for payload in _iter_sse_data(resp, sock=upstream_sock,
+                                          idle_timeout=window,
+                                          has_pending=lambda: bool(pending)):
+                if payload is None:
+                    # Upstream went idle with deltas buffered -- flush
+                    # now instead of waiting for the next token.
+                    flush_pending()
+                    last_flush = time.monotonic()
                     continue
-                payload = line[6:]
-                if payload == "[DONE]":
+                if payload == b"[DONE]":
                     break
                 try:
-                    chunk = json.loads(payload)
+                    chunk = loads(payload)
                     delta = chunk.get("choices", [{}])[0].get("delta", {})
                     content = delta.get("content", "")
                     if content:
-                        collected_text += content
-                        event = {
-                            "jsonrpc": "2.0",
-                            "id": rpc_id,
-                            "result": {
-                                "id": task_id,
-                                "status": {
-                                    "state": "WORKING",
-                                    "message": {
-                                        "role": "agent",
-                                        "parts": [{"kind": "text", "text": content}],
-                                    },
-                                },
-                            },
-                        }
-                        self._write_sse("message/stream", event)
-                except (json.JSONDecodeError, KeyError, IndexError):
+                        collected.append(content)
+                        pending.append(content)
+                        now = time.monotonic()
+                        if now - last_flush >= window:
+                            flush_pending()
+                            last_flush = now
+                except (ValueError, KeyError, IndexError):
                     continue
 
+            if pending:
+                flush_pending()
+
             # Send final completed event
             final_event = {
                 "jsonrpc": "2.0",
@@ -258,7 +673,7 @@ class A2ABridgeHandler(BaseHTTPRequestHandler):
                         "state": "COMPLETED",
                         "message": {
                             "role": "agent",
-                            "parts": [{"kind": "text", "text": collected_text}],
+                            "parts": [{"kind": "text", "text": "".join(collected)}],
                         },
                     },
                 },
@@ -268,14 +683,30 @@ class A2ABridgeHandler(BaseHTTPRequestHandler):
             pass
         finally:
             resp.close()
+            # The stream may not be fully drained (we break on [DONE]),
+            # so the socket can't be reused -- return a fresh one next time.
+            _drop_gateway_conn()
+
+    def _send_frames(self, frames):
+        """Emit byte fragments in one writev syscall via sendmsg,
+        skipping the concatenation; falls back to a joined write where
+        sendmsg is unavailable (non-Linux)."""
+        sock = self.connection
+        if not hasattr(sock, "sendmsg"):
+            self.wfile.write(b"".join(frames))
+            self.wfile.flush()
+            return
+        total = sum(len(f) for f in frames)
+        sent = sock.sendmsg(frames)
+        if sent < total:
+            sock.sendall(b"".join(frames)[sent:])
 
     def _write_sse(self, event_type, data):
-        line = f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
-        self.wfile.write(line.encode())
-        self.wfile.flush()
+        self._send_frames((b"event: ", event_type.encode(), b"\ndata: ",
+                           dumps(data), b"\n\n"))
 
     def _send_json(self, status, obj):
-        body = json.dumps(obj).encode()
+        body = dumps(obj)
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
@@ -283,8 +714,31 @@ class A2ABridgeHandler(BaseHTTPRequestHandler):
         self.wfile.write(body)
 
 
+class A2ABridgeServer(ThreadingHTTPServer):
+    """Concurrent server so a slow message/stream doesn't block
+    /healthz probes or other A2A clients.
+
+    Connections are dispatched onto a bounded worker pool rather than
+    one unbounded thread each, so resource use stays flat when many SSE
+    streams are held open at once (BRIDGE_MAX_WORKERS, default 64).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
+
 if __name__ == "__main__":
-    server = HTTPServer(("0.0.0.0", LISTEN_PORT), A2ABridgeHandler)
+    server = A2ABridgeServer(("0.0.0.0", LISTEN_PORT), A2ABridgeHandler)
     print(f"[a2a-bridge] Listening on :{LISTEN_PORT}")
     print(f"[a2a-bridge] Gateway: {GATEWAY_URL}")
     print(f"[a2a-bridge] Agent: {AGENT_ID or '(default)'}")